@@ -161,9 +161,14 @@ ComputeServer::ComputeServer(ComponentId_t id, Params& params) :
     std::string key_dist = params.find<std::string>("key_distribution", "zipfian"); // New parameter
     read_ratio = params.find<double>("read_ratio", 0.95);
     btree_fanout = params.find<uint32_t>("btree_fanout", 16);
+    prefetch_lines_per_node = params.find<uint32_t>("prefetch_lines_per_node", 1);
     key_range = params.find<uint64_t>("key_range", 1000000);
     verbose_level = params.find<int>("verbose", 0);
 
+    if (prefetch_lines_per_node == 0) {
+        prefetch_lines_per_node = 1;  // Always at least one read per node
+    }
+
     // Override zipfian_alpha based on distribution type
     if (key_dist == "uniform") {
         zipfian_alpha = 0.0;  // Force uniform distribution
@@ -224,6 +229,8 @@ ComputeServer::ComputeServer(ComponentId_t id, Params& params) :
                workload_type.c_str(), ops_per_second, read_ratio);
     out.output("  Key distribution: %s (alpha=%.2f), Key range: %lu\n", 
                (zipfian_alpha <= 0.0) ? "UNIFORM" : "ZIPFIAN", zipfian_alpha, key_range);
+    out.output("  B+tree fanout: %u, Parallel reads per node: %u\n",
+               btree_fanout, prefetch_lines_per_node);
     
     // DEBUG: Force output of parameters for debugging
     out.output("DEBUG: key_dist='%s', zipfian_alpha=%.6f, key_range=%lu\n", 
@@ -337,7 +344,9 @@ void ComputeServer::handleMemoryEvent(SST::Interfaces::StandardMem::Request* req
     if (auto read_resp = dynamic_cast<SST::Interfaces::StandardMem::ReadResp*>(req)) {
         // Handle read response with async state machine
         dbg.debug(CALL_INFO, 3, 0, "Network READ response received, req_id=%lu\n", req_id);
-        handle_read_response(req_id, read_resp->data);
+        if (!handle_read_chunk(req_id, read_resp->data)) {
+            handle_read_response(req_id, read_resp->data);
+        }
         
     } else if (auto write_resp = dynamic_cast<SST::Interfaces::StandardMem::WriteResp*>(req)) {
         // Handle write response
@@ -442,23 +451,17 @@ void ComputeServer::btree_insert_async(uint64_t key, uint64_t value) {
     dbg.debug(CALL_INFO, 2, 0, "B+Tree INSERT (async): key=%lu, value=%lu\n", key, value);
     out.output("\n🔹 INSERT Operation (async): key=%lu, value=%lu\n", key, value);
     
-    // Create read request for root node to start traversal
-    auto req = new SST::Interfaces::StandardMem::Read(root_address, get_serialized_node_size());
-    auto req_id = req->getID();
-    
     // Track this async operation
-    pending_ops[req_id] = AsyncOperation();
-    pending_ops[req_id].type = AsyncOperation::INSERT;
-    pending_ops[req_id].key = key;
-    pending_ops[req_id].value = value;
-    pending_ops[req_id].current_level = 0;
-    pending_ops[req_id].current_address = root_address;
-    pending_ops[req_id].start_time = getCurrentSimTime();
-    
-    // Send read request
-    SST::Interfaces::StandardMem* target_interface = get_interface_for_address(root_address);
-    target_interface->send(req);
-    stat_network_reads->addData(1);
+    AsyncOperation op;
+    op.type = AsyncOperation::INSERT;
+    op.key = key;
+    op.value = value;
+    op.current_level = 0;
+    op.current_address = root_address;
+    op.start_time = getCurrentSimTime();
+    
+    // Read root node to start traversal
+    send_node_read(root_address, op);
     
     out.output("   Started async traversal from root=0x%lx\n", root_address);
 }
@@ -467,22 +470,16 @@ void ComputeServer::btree_search_async(uint64_t key) {
     dbg.debug(CALL_INFO, 2, 0, "B+tree SEARCH (async): key=%lu\n", key);
     out.output("\n🔍 SEARCH Operation (async): key=%lu\n", key);
     
-    // Create read request for root node
-    auto req = new SST::Interfaces::StandardMem::Read(root_address, get_serialized_node_size());
-    auto req_id = req->getID();
-    
     // Track this async operation
-    pending_ops[req_id] = AsyncOperation();
-    pending_ops[req_id].type = AsyncOperation::SEARCH;
-    pending_ops[req_id].key = key;
-    pending_ops[req_id].current_level = 0;
-    pending_ops[req_id].current_address = root_address;
-    pending_ops[req_id].start_time = getCurrentSimTime();
-    
-    // Send read request
-    SST::Interfaces::StandardMem* target_interface = get_interface_for_address(root_address);
-    target_interface->send(req);
-    stat_network_reads->addData(1);
+    AsyncOperation op;
+    op.type = AsyncOperation::SEARCH;
+    op.key = key;
+    op.current_level = 0;
+    op.current_address = root_address;
+    op.start_time = getCurrentSimTime();
+    
+    // Read root node
+    send_node_read(root_address, op);
     
     out.output("   Started async traversal from root=0x%lx\n", root_address);
 }
@@ -620,10 +617,77 @@ SST::Interfaces::StandardMem* ComputeServer::get_interface_for_address(uint64_t
     }
 }
 
+void ComputeServer::send_node_read(uint64_t address, const AsyncOperation& op) {
+    // Fetch one B+tree node, split into prefetch_lines_per_node parallel reads.
+    // The operation state is tracked under the first (lead) request; the node is
+    // handed to handle_read_response only once every chunk has arrived.
+    size_t node_size = get_serialized_node_size();
+    size_t num_chunks = std::min<size_t>(prefetch_lines_per_node, node_size);
+    size_t chunk_size = (node_size + num_chunks - 1) / num_chunks;
+    num_chunks = (node_size + chunk_size - 1) / chunk_size;
+    
+    SST::Interfaces::StandardMem* target_interface = get_interface_for_address(address);
+    SST::Interfaces::StandardMem::Request::id_t lead_id = 0;
+    std::vector<SST::Interfaces::StandardMem::Request*> reqs;
+    
+    for (size_t i = 0; i < num_chunks; i++) {
+        size_t offset = i * chunk_size;
+        size_t size = std::min(chunk_size, node_size - offset);
+        
+        auto req = new SST::Interfaces::StandardMem::Read(address + offset, size);
+        auto req_id = req->getID();
+        
+        if (i == 0) {
+            lead_id = req_id;
+            pending_ops[lead_id] = op;
+        }
+        if (num_chunks > 1) {
+            pending_chunks[req_id] = NodeReadChunk{lead_id, offset};
+        }
+        reqs.push_back(req);
+    }
+    
+    if (num_chunks > 1) {
+        pending_assemblies[lead_id] = NodeReadAssembly{static_cast<uint32_t>(num_chunks),
+                                                       std::vector<uint8_t>(node_size, 0)};
+    }
+    
+    // Issue all chunk reads back-to-back so they overlap in the network
+    for (auto req : reqs) {
+        target_interface->send(req);
+        stat_network_reads->addData(1);
+    }
+}
+
 // ═══════════════════════════════════════════════════════════════════════════
 // ASYNC RESPONSE HANDLERS - State machine continuation
 // ═══════════════════════════════════════════════════════════════════════════
 
+bool ComputeServer::handle_read_chunk(SST::Interfaces::StandardMem::Request::id_t req_id,
+                                      const std::vector<uint8_t>& data) {
+    // Returns true if this response was one chunk of a split node read
+    auto chunk_it = pending_chunks.find(req_id);
+    if (chunk_it == pending_chunks.end()) {
+        return false;
+    }
+    
+    NodeReadChunk chunk = chunk_it->second;
+    pending_chunks.erase(chunk_it);
+    
+    auto& assembly = pending_assemblies[chunk.lead_id];
+    size_t copy_size = std::min(data.size(), assembly.data.size() - chunk.offset);
+    std::memcpy(assembly.data.data() + chunk.offset, data.data(), copy_size);
+    
+    if (--assembly.remaining == 0) {
+        // All chunks arrived - continue the operation with the full node
+        std::vector<uint8_t> node_data = std::move(assembly.data);
+        pending_assemblies.erase(chunk.lead_id);
+        handle_read_response(chunk.lead_id, node_data);
+    }
+    
+    return true;
+}
+
 void ComputeServer::handle_read_response(SST::Interfaces::StandardMem::Request::id_t req_id,
                                          const std::vector<uint8_t>& data) {
     // Check if this is one of our tracked async operations
@@ -662,13 +726,7 @@ void ComputeServer::handle_read_response(SST::Interfaces::StandardMem::Request::
                 op.current_level++;
                 op.current_address = child_addr;
                 
-                auto next_req = new SST::Interfaces::StandardMem::Read(child_addr, get_serialized_node_size());
-                auto next_req_id = next_req->getID();
-                pending_ops[next_req_id] = op;
-                
-                SST::Interfaces::StandardMem* target_interface = get_interface_for_address(child_addr);
-                target_interface->send(next_req);
-                stat_network_reads->addData(1);
+                send_node_read(child_addr, op);
                 
                 pending_ops.erase(req_id);
                 return;
@@ -763,19 +821,13 @@ void ComputeServer::handle_read_response(SST::Interfaces::StandardMem::Request::
         // Record parent relationship for potential splits
         parent_map[child_addr] = op.current_address;
         
-        // Create next read request
-        auto next_req = new SST::Interfaces::StandardMem::Read(child_addr, get_serialized_node_size());
-        auto next_req_id = next_req->getID();
-        
         // Transfer state to new request
-        pending_ops[next_req_id] = op;
-        pending_ops[next_req_id].current_level++;
-        pending_ops[next_req_id].current_address = child_addr;
+        AsyncOperation next_op = op;
+        next_op.current_level++;
+        next_op.current_address = child_addr;
         
         // Send request
-        SST::Interfaces::StandardMem* target_interface = get_interface_for_address(child_addr);
-        target_interface->send(next_req);
-        stat_network_reads->addData(1);
+        send_node_read(child_addr, next_op);
         
         // Clean up old request
         pending_ops.erase(req_id);
@@ -1175,13 +1227,7 @@ void ComputeServer::handle_split_response(AsyncOperation& op) {
                     op.current_level = 0;
                     
                     // Start traversal from root using separator key
-                    auto req = new SST::Interfaces::StandardMem::Read(root_address, get_serialized_node_size());
-                    auto req_id = req->getID();
-                    pending_ops[req_id] = op;
-                    
-                    SST::Interfaces::StandardMem* target_interface = get_interface_for_address(root_address);
-                    target_interface->send(req);
-                    stat_network_reads->addData(1);
+                    send_node_read(root_address, op);
                 } else {
                     // Have parent address, read it directly
                     out.output("   → Phase 3: Reading parent 0x%lx to insert separator key=%lu\n",
@@ -1189,13 +1235,7 @@ void ComputeServer::handle_split_response(AsyncOperation& op) {
                     
                     op.split_phase = AsyncOperation::READ_PARENT;
                     
-                    auto req = new SST::Interfaces::StandardMem::Read(op.parent_address, get_serialized_node_size());
-                    auto req_id = req->getID();
-                    pending_ops[req_id] = op;
-                    
-                    SST::Interfaces::StandardMem* target_interface = get_interface_for_address(op.parent_address);
-                    target_interface->send(req);
-                    stat_network_reads->addData(1);
+                    send_node_read(op.parent_address, op);
                 }
             }
             break;
@@ -112,6 +112,7 @@ public:
         {"zipfian_alpha", "Zipfian distribution parameter", "0.9"},
         {"read_ratio", "Percentage of read operations (0.0-1.0)", "0.95"},
         {"btree_fanout", "B+tree fanout (keys per node)", "16"},
+        {"prefetch_lines_per_node", "Number of parallel reads issued to fetch one B+tree node (1 = single read)", "1"},
         {"key_range", "Range of keys (0 to key_range)", "1000000"},
         {"verbose", "Verbose debug output", "0"}
     )
@@ -171,6 +172,7 @@ private:
     double zipfian_alpha;
     double read_ratio;
     uint32_t btree_fanout;
+    uint32_t prefetch_lines_per_node; // Parallel reads per node fetch
     uint64_t key_range;
     int verbose_level;
 
@@ -193,6 +195,19 @@ private:
     // Async operation tracking - state machine
     std::map<SST::Interfaces::StandardMem::Request::id_t, AsyncOperation> pending_ops;
     
+    // Node reads split across several parallel requests (prefetch_lines_per_node > 1).
+    // pending_ops is keyed by the lead (first) request; every chunk maps back to it.
+    struct NodeReadChunk {
+        SST::Interfaces::StandardMem::Request::id_t lead_id;
+        size_t offset;                  // Byte offset of this chunk within the node
+    };
+    struct NodeReadAssembly {
+        uint32_t remaining;             // Chunks still outstanding
+        std::vector<uint8_t> data;      // Reassembled node bytes
+    };
+    std::map<SST::Interfaces::StandardMem::Request::id_t, NodeReadChunk> pending_chunks;
+    std::map<SST::Interfaces::StandardMem::Request::id_t, NodeReadAssembly> pending_assemblies;
+    
     // Statistics
     Statistic<uint64_t>* stat_inserts;
     Statistic<uint64_t>* stat_searches;
@@ -208,6 +223,7 @@ private:
     // Helper functions
     uint64_t allocate_node_address(uint64_t node_id, uint32_t level);
     SST::Interfaces::StandardMem* get_interface_for_address(uint64_t address);
+    void send_node_read(uint64_t address, const AsyncOperation& op);
     void process_btree_operation(const WorkloadOp& op);
     
     // B+tree structure management
@@ -219,6 +235,8 @@ private:
     void handle_read_response(SST::Interfaces::StandardMem::Request::id_t req_id, 
                              const std::vector<uint8_t>& data);
     void handle_write_response(SST::Interfaces::StandardMem::Request::id_t req_id);
+    bool handle_read_chunk(SST::Interfaces::StandardMem::Request::id_t req_id,
+                          const std::vector<uint8_t>& data);
     void handle_leaf_operation(AsyncOperation& op, BTreeNode& leaf);
     
     // Async split operations
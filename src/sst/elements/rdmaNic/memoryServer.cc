@@ -310,6 +310,20 @@ std::vector<uint8_t> MemoryServer::read_memory(uint64_t address, size_t size) {
         if (size <= block_data.size()) {
             return std::vector<uint8_t>(block_data.begin(), block_data.begin() + size);
         }
+    } else if (!memory_blocks.empty()) {
+        // Partial read (e.g. one chunk of a node fetched with parallel reads):
+        // find the block that starts before this address and contains it
+        it = memory_blocks.upper_bound(address);
+        if (it != memory_blocks.begin()) {
+            --it;
+            const auto& block_data = it->second.data;
+            uint64_t offset = address - it->first;
+            if (offset + size <= block_data.size()) {
+                it->second.last_access = getCurrentSimTime();
+                it->second.access_count++;
+                return std::vector<uint8_t>(block_data.begin() + offset, block_data.begin() + offset + size);
+            }
+        }
     }
     
     // Return zeros if block doesn't exist
@@ -16,6 +16,7 @@
 #include <sst/core/event.h>
 #include <sst/core/sst_types.h>
 #include <sst/core/interfaces/stdMem.h>
+#include <map>
 #include <unordered_map>
 #include <vector>
 
@@ -122,8 +123,8 @@ private:
     SimTime_t lock_timeout;
     int verbose_level;
 
-    // Memory storage
-    std::unordered_map<uint64_t, MemoryBlock> memory_blocks;
+    // Memory storage (ordered so reads can start inside a block)
+    std::map<uint64_t, MemoryBlock> memory_blocks;
     uint64_t memory_used;            // Bytes currently used
     uint64_t base_address;           // Base address for this memory server
 
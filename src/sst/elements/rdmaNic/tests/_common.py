@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Shared configuration for the single compute/memory pair B+tree tests
+(test_01, test_02, test_03, test_06).
+"""
+
+import logging
+import os
+import sys
+import textwrap
+from types import MappingProxyType
+
+import sst
+
+# Test banners are only shown when SST_TEST_VERBOSE is set
+log = logging.getLogger("sst.rdmaNic.tests")
+if os.getenv("SST_TEST_VERBOSE"):
+    log.setLevel(logging.INFO)
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(_handler)
+
+# Compute server parameters common to every single-node test
+COMPUTE_BASE = MappingProxyType({
+    "verbose": 1,
+    "node_id": 0,
+    "num_memory_nodes": 1,
+    "btree_fanout": 16,
+    "key_distribution": "uniform",
+})
+
+# Memory server parameters common to every single-node test
+MEMORY_BASE = MappingProxyType({
+    "verbose": 1,
+    "memory_server_id": 0,
+    "memory_size_mb": 16,
+    "base_addr": "0x10000000",
+})
+
+
+def make_pair(compute_overrides, memory_overrides=None):
+    """Create one compute server linked directly to one memory server.
+
+    The override dicts are merged on top of COMPUTE_BASE / MEMORY_BASE.
+    Returns the (compute, memory, link) triple.
+    """
+    compute = sst.Component("compute_0", "rdmaNic.computeServer")
+    compute.addParams({**COMPUTE_BASE, **compute_overrides})
+
+    memory = sst.Component("memory_0", "rdmaNic.memoryServer")
+    memory.addParams({**MEMORY_BASE, **(memory_overrides or {})})
+
+    # Create interfaces - standardInterface with simple direct connection
+    compute_iface = compute.setSubComponent("mem_interface_0", "memHierarchy.standardInterface")
+    memory_iface = memory.setSubComponent("mem_interface", "memHierarchy.standardInterface")
+
+    # Connect them directly with lowlink ports
+    link = sst.Link("memory_link")
+    link.connect((compute_iface, "lowlink", "1ns"), (memory_iface, "lowlink", "1ns"))
+
+    return compute, memory, link
+
+
+def _build_single_node_test(ops_per_sec, duration_us, read_ratio, key_range, fanout):
+    """Build a single-node B+tree test from the parameters that vary per test.
+
+    Returns the (compute, memory, link) triple from make_pair().
+    """
+    return make_pair({
+        "operations_per_second": ops_per_sec,
+        "simulation_duration_us": duration_us,
+        "read_ratio": read_ratio,
+        "key_range": key_range,
+        "btree_fanout": fanout,
+    })
+
+
+def banner(title, text):
+    """Log a test's description as one message framed by separator lines."""
+    rule = "=" * 70
+    log.info("\n".join([rule, title, rule, textwrap.dedent(text).strip("\n"), rule]))
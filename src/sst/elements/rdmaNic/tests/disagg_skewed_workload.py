@@ -2,8 +2,14 @@
 """
 Disaggregated Memory B+tree Demo - SKEWED Key Distribution (Zipfian)
 Tests disaggregated B+tree with skewed (hot key) access patterns.
+
+Set WORKLOAD_DIST=uniform to run the same topology and operation budget
+with a uniform key distribution for comparison.
 """
 
+import itertools
+import os
+
 import sst
 
 # Configuration
@@ -11,16 +17,32 @@ num_compute_nodes = 2
 num_memory_nodes = 2
 total_memory_instances = num_compute_nodes * num_memory_nodes  # Dedicated instances
 
-# Track interfaces for linking
-compute_interfaces = {}
-memory_interfaces = {}
+# Key distribution: "zipfian" (default) or "uniform"
+workload_dist = os.getenv("WORKLOAD_DIST", "zipfian")
+if workload_dist == "zipfian":
+    zipfian_alpha = 0.99  # Standard YCSB skew - strong hot key pattern
+elif workload_dist == "uniform":
+    zipfian_alpha = 0.0
+else:
+    raise ValueError(f"Unknown WORKLOAD_DIST '{workload_dist}' (expected 'zipfian' or 'uniform')")
+
+# Every (compute_id, memory_id) connection, in creation order
+pairs = list(itertools.product(range(num_compute_nodes), range(num_memory_nodes)))
+
+# Track interfaces for linking, indexed [compute_id][memory_id]
+compute_interfaces = [[None] * num_memory_nodes for _ in range(num_compute_nodes)]
+memory_interfaces = [[None] * num_memory_nodes for _ in range(num_compute_nodes)]
 
-print(f"=== Disaggregated Memory B+tree: Skewed Distribution (Zipfian) ===")
+print(f"=== Disaggregated Memory B+tree: {workload_dist.capitalize()} Distribution ===")
 print(f"Architecture: {num_compute_nodes} Compute Servers → {total_memory_instances} Memory Server Instances")
-print(f"Key Distribution: ZIPFIAN (skewed with hot keys)")
-print(f"Expected Pattern: Few hot keys accessed frequently, many cold keys rarely accessed")
+if workload_dist == "zipfian":
+    print(f"Key Distribution: ZIPFIAN (skewed with hot keys, alpha={zipfian_alpha})")
+    print(f"Expected Pattern: Few hot keys accessed frequently, many cold keys rarely accessed")
+else:
+    print(f"Key Distribution: UNIFORM (every key equally likely)")
+    print(f"Expected Pattern: Accesses spread evenly across the key range")
 
-# Create compute servers with ZIPFIAN key distribution
+# Create compute servers with the selected key distribution
 compute_servers = []
 for compute_id in range(num_compute_nodes):
     compute_server = sst.Component(
@@ -35,58 +57,61 @@ for compute_id in range(num_compute_nodes):
         "simulation_duration_us": 20000,  # 20ms - longer for better statistics
         "read_ratio": 0.7,
         "key_range": 100,  # Small range to see distribution clearly
-        "key_distribution": "zipfian",  # Force Zipfian distribution
-        "zipfian_alpha": 0.9,  # High skew - strong hot key pattern
+        "btree_fanout": 128,  # Wide nodes - one remote round-trip covers more keys
+        "prefetch_lines_per_node": 8,  # Fetch each node with 8 parallel reads
+        "key_distribution": workload_dist,
+        "zipfian_alpha": zipfian_alpha,
     })
     
-    # Create RDMA interfaces as subcomponents for connecting to memory servers
-    for memory_id in range(num_memory_nodes):
-        interface_name = f"rdma_nic_{memory_id}"
-        rdma_interface = compute_server.setSubComponent(interface_name, "memHierarchy.standardInterface")
-        rdma_interface.addParams({"debug": 0, "debug_level": 1})
-        compute_interfaces[(compute_id, memory_id)] = rdma_interface
-    
     compute_servers.append(compute_server)
 
+# Create RDMA interfaces as subcomponents for connecting to memory servers
+for compute_id, memory_id in pairs:
+    interface_name = f"rdma_nic_{memory_id}"
+    rdma_interface = compute_servers[compute_id].setSubComponent(interface_name, "memHierarchy.standardInterface")
+    rdma_interface.addParams({"debug": 0, "debug_level": 1})
+    compute_interfaces[compute_id][memory_id] = rdma_interface
+
 # Dedicated memory servers - one instance per connection
 memory_servers = []
-for compute_id in range(num_compute_nodes):
-    for memory_id in range(num_memory_nodes):
-        # Each memory server instance handles exactly one interface
-        memory_server = sst.Component(
-            f"memory_server_c{compute_id}_m{memory_id}", 
-            "rdmaNic.memoryServer"
-        )
-        memory_server.addParams({
-            "verbose": 1,
-            "memory_server_id": memory_id,
-            "memory_size_mb": 16,
-            "base_addr": hex(0x10000000 + memory_id * 0x1000000),
-        })
-        
-        # Single RDMA interface per dedicated instance
-        rdma_interface = memory_server.setSubComponent("rdma_nic", "memHierarchy.standardInterface")
-        rdma_interface.addParams({"debug": 0, "debug_level": 1})
-        memory_interfaces[(compute_id, memory_id)] = rdma_interface
-        
-        memory_servers.append(memory_server)
+for compute_id, memory_id in pairs:
+    # Each memory server instance handles exactly one interface
+    memory_server = sst.Component(
+        f"memory_server_c{compute_id}_m{memory_id}", 
+        "rdmaNic.memoryServer"
+    )
+    memory_server.addParams({
+        "verbose": 1,
+        "memory_server_id": memory_id,
+        "memory_size_mb": 16,
+        "base_addr": hex(0x10000000 + memory_id * 0x1000000),
+    })
+    
+    # Single RDMA interface per dedicated instance
+    rdma_interface = memory_server.setSubComponent("rdma_nic", "memHierarchy.standardInterface")
+    rdma_interface.addParams({"debug": 0, "debug_level": 1})
+    memory_interfaces[compute_id][memory_id] = rdma_interface
+    
+    memory_servers.append(memory_server)
 
 print(f"Created {len(compute_servers)} compute servers and {len(memory_servers)} dedicated memory server instances")
 
 # Create dedicated connections (one-to-one between instances)
 connections_created = 0
-for compute_id in range(num_compute_nodes):
-    for memory_id in range(num_memory_nodes):
-        # Link compute server interface to corresponding dedicated memory server instance
-        compute_interface = compute_interfaces[(compute_id, memory_id)]
-        memory_interface = memory_interfaces[(compute_id, memory_id)]
-        
-        link_name = f"rdma_link_c{compute_id}_m{memory_id}"
-        link = sst.Link(link_name)
-        link.connect((compute_interface, "lowlink", "1ns"), 
-                    (memory_interface, "lowlink", "1ns"))
-        
-        connections_created += 1
+for compute_id, memory_id in pairs:
+    # Link compute server interface to corresponding dedicated memory server instance
+    compute_interface = compute_interfaces[compute_id][memory_id]
+    memory_interface = memory_interfaces[compute_id][memory_id]
+    
+    link_name = f"rdma_link_c{compute_id}_m{memory_id}"
+    link = sst.Link(link_name)
+    link.connect((compute_interface, "lowlink", "1ns"), 
+                (memory_interface, "lowlink", "1ns"))
+    
+    connections_created += 1
 
 print(f"Created {connections_created} dedicated RDMA connections")
-print("Expected Result: Zipfian distribution with hot keys dominating access frequency")
+if workload_dist == "zipfian":
+    print("Expected Result: Zipfian distribution with hot keys dominating access frequency")
+else:
+    print("Expected Result: Uniform distribution with no dominant hot keys")